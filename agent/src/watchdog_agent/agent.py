@@ -1,14 +1,167 @@
 """AI agent using Claude API for topic monitoring."""
 
-import json
+import asyncio
+import functools
 import hashlib
+import logging
+import time
+import urllib.parse
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 import anthropic
 import httpx
-from bs4 import BeautifulSoup
+import orjson
+
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:  # Fall back to the stdlib's fastest general hash
+    def _hasher():
+        return hashlib.blake2b(digest_size=16)
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:  # Fall back to the pure-Python parser
+    HTMLParser = None
+    from bs4 import BeautifulSoup
+
+log = logging.getLogger(__name__)
+
+# Maximum number of topics analyzed together in one Claude request
+_BATCH_SIZE = 5
+
+_ANALYSIS_INSTRUCTIONS = """You are monitoring topics for updates. For each topic below, analyze the gathered information and determine if there are any significant NEW updates or developments.
+
+Report your findings for every topic with the report_updates tool, using each topic's exact name.
+
+Only set has_significant_update to true if there is genuinely NEW information that the user should know about. Don't report updates for things that haven't changed."""
+
+# Structured output schema Claude must fill in via forced tool use
+_REPORT_TOOL = {
+    "name": "report_updates",
+    "description": "Report whether each monitored topic has a significant new update.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "topic": {"type": "string", "description": "Exact topic name"},
+                        "has_significant_update": {"type": "boolean"},
+                        "summary": {
+                            "type": "string",
+                            "description": "Brief 1-2 sentence summary of any updates or current status",
+                        },
+                        "confidence": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+                        "source_url": {
+                            "type": ["string", "null"],
+                            "description": "Most relevant URL, or null",
+                        },
+                    },
+                    "required": ["topic", "has_significant_update", "summary", "confidence", "source_url"],
+                },
+            },
+        },
+        "required": ["results"],
+    },
+}
+
+# Page chrome stripped before extracting text
+_BOILERPLATE_TAGS = ["script", "style", "nav", "footer", "header"]
+
+# Title links and snippets of DuckDuckGo HTML results
+_RESULT_SELECTOR = ".result .result__title a, .result .result__snippet"
+
+# Stop downloading once this much HTML has been read; enough to yield the
+# extracted text we keep without pulling in multi-MB pages
+_MAX_PAGE_BYTES = 64 * 1024
+_MAX_SEARCH_BYTES = 256 * 1024
+
+# Characters of extracted text kept per watched URL
+_MAX_URL_TEXT = 3000
+
+# Total characters of gathered text per topic; bounds memory per check and
+# the size of the prompt sent to Claude
+_GATHER_BUDGET = 48_000
+
+# Seconds a fetched page or search result is shared between topics
+_URL_CACHE_TTL = 15 * 60
+_SEARCH_CACHE_TTL = 30 * 60
+
+
+@functools.lru_cache(maxsize=256)
+def _safe_name(name: str) -> str:
+    """Turn a topic name into a filesystem-safe cache file stem."""
+    return "".join(c if c.isalnum() else "_" for c in name)
+
+
+def _content_hash(parts: Iterable[str]) -> str:
+    """Hash text parts incrementally, without joining them into one string."""
+    h = _hasher()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+async def _read_capped(response: httpx.Response, limit: int) -> str:
+    """Read at most ``limit`` bytes of a streamed response body as text."""
+    chunks = []
+    total = 0
+    async for chunk in response.aiter_bytes(8192):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= limit:
+            break
+    return b"".join(chunks)[:limit].decode(response.charset_encoding or "utf-8", errors="replace")
+
+
+def _extract_text(html: str) -> str:
+    """Extract visible text from an HTML document."""
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        for node in tree.css(",".join(_BOILERPLATE_TAGS)):
+            node.decompose()
+        return tree.body.text(separator="\n", strip=True) if tree.body else ""
+
+    soup = BeautifulSoup(html, "html.parser")
+    for element in soup(_BOILERPLATE_TAGS):
+        element.decompose()
+    return soup.get_text(separator="\n", strip=True)
+
+
+def _parse_search_results(html: str, limit: int = 5) -> list[tuple[str, str, str]]:
+    """Parse a DuckDuckGo HTML results page into (title, href, snippet) tuples."""
+    # One selector pass returns titles and snippets in document order,
+    # instead of two lookups per result
+    if HTMLParser is not None:
+        nodes = (
+            (node.text(strip=True), node.attributes.get("href") or "",
+             "result__snippet" in (node.attributes.get("class") or ""))
+            for node in HTMLParser(html).css(_RESULT_SELECTOR)
+        )
+    else:
+        nodes = (
+            (node.get_text(strip=True), node.get("href", ""),
+             "result__snippet" in node.get("class", []))
+            for node in BeautifulSoup(html, "html.parser").select(_RESULT_SELECTOR)
+        )
+
+    parsed = []
+    for text, href, is_snippet in nodes:
+        if is_snippet:
+            # A snippet belongs to the title just before it
+            if parsed and not parsed[-1][2]:
+                parsed[-1][2] = text
+        elif len(parsed) < limit:
+            parsed.append([text, href, ""])
+        else:
+            break
+    return [tuple(result) for result in parsed]
 
 
 @dataclass
@@ -36,53 +189,115 @@ class UpdateResult:
 class WatchdogAgent:
     """AI agent that monitors topics using Claude."""
 
-    def __init__(self, api_key: str | None = None, cache_dir: Path | None = None):
-        self.client = anthropic.Anthropic(api_key=api_key)
+    def __init__(self, api_key: str | None = None, cache_dir: Path | None = None,
+                 max_concurrency: int = 10):
+        self.client = anthropic.AsyncAnthropic(api_key=api_key)
         self.cache_dir = cache_dir or Path.home() / ".cache" / "watchdog-agent"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.http_client = httpx.Client(
+        # One pooled client for all topics; keep connections alive between
+        # daemon cycles so repeat hosts skip the TCP/TLS handshake
+        self.http_client = httpx.AsyncClient(
             timeout=30,
             follow_redirects=True,
-            headers={"User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0"}
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=300.0,
+            ),
+            headers={
+                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0",
+                "Accept-Encoding": "gzip, br",
+            }
         )
+        # Shared across topics so parallel checks don't flood remote hosts
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._search_headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        # In-process caches so overlapping topics fetch each resource once
+        self._url_cache: dict[str, tuple[float, asyncio.Future]] = {}
+        self._search_cache: dict[str, tuple[float, asyncio.Future]] = {}
+        # Conditional request state per URL, shared by every topic watching it
+        self._url_validators: dict[str, dict] = {}
+
+    def clear_caches(self):
+        """Forget cached pages and search results so the next check refetches."""
+        self._url_cache.clear()
+        self._search_cache.clear()
+
+    async def _limited(self, coro):
+        """Run a coroutine while holding the shared concurrency semaphore."""
+        async with self._semaphore:
+            return await coro
+
+    async def _cached(self, cache: dict, key: str, ttl: float, func, *args):
+        """
+        Run ``func(*args)`` under the concurrency limit, reusing the result
+        for ``key`` while it is younger than ``ttl`` seconds.
+
+        The pending task is cached rather than its result, so concurrent
+        callers asking for the same key share a single request.
+        """
+        now = time.monotonic()
+        hit = cache.get(key)
+        if hit and now - hit[0] < ttl:
+            return await hit[1]
+
+        task = asyncio.ensure_future(self._limited(func(*args)))
+        cache[key] = (now, task)
+        return await task
 
     def _get_cache_path(self, topic_name: str) -> Path:
-        safe_name = "".join(c if c.isalnum() else "_" for c in topic_name)
-        return self.cache_dir / f"{safe_name}.json"
+        return self.cache_dir / f"{_safe_name(topic_name)}.json"
 
     def _load_topic_cache(self, topic: WatchTopic) -> dict:
         cache_path = self._get_cache_path(topic.name)
         if cache_path.exists():
             try:
-                return json.loads(cache_path.read_text())
-            except (json.JSONDecodeError, IOError):
+                return orjson.loads(cache_path.read_bytes())
+            except (orjson.JSONDecodeError, IOError):
                 pass
         return {}
 
     def _save_topic_cache(self, topic: WatchTopic, data: dict):
         cache_path = self._get_cache_path(topic.name)
-        cache_path.write_text(json.dumps(data, indent=2, default=str))
+        cache_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
 
-    def _fetch_url_content(self, url: str) -> str | None:
-        """Fetch and extract text content from a URL."""
-        try:
-            response = self.http_client.get(url)
-            response.raise_for_status()
+    async def _fetch_url_content(self, url: str, validators: dict | None = None) -> str | None:
+        """
+        Fetch and extract text content from a URL.
 
-            soup = BeautifulSoup(response.text, "html.parser")
+        If ``validators`` is given it holds the ETag, Last-Modified and text
+        from the previous fetch; the request is made conditional and the
+        stored text is reused on 304. It is updated in place on a fresh fetch.
+        """
+        headers = {}
+        if validators and validators.get("content") is not None:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
 
-            # Remove script and style elements
-            for element in soup(["script", "style", "nav", "footer", "header"]):
-                element.decompose()
+        try:
+            async with self.http_client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304 and headers:
+                    return validators["content"]
+                response.raise_for_status()
+                html = await _read_capped(response, _MAX_PAGE_BYTES)
 
-            text = soup.get_text(separator="\n", strip=True)
             # Limit content size
-            return text[:15000]
+            text = _extract_text(html)[:_MAX_URL_TEXT]
+
+            if validators is not None:
+                validators.clear()
+                validators["etag"] = response.headers.get("ETag")
+                validators["last_modified"] = response.headers.get("Last-Modified")
+                validators["content"] = text
+            return text
         except Exception as e:
-            print(f"Failed to fetch {url}: {e}")
+            log.warning("Failed to fetch %s: %s", url, e)
             return None
 
-    def _search_web(self, query: str) -> list[dict]:
+    async def _search_web(self, query: str) -> list[dict]:
         """
         Search the web using DuckDuckGo HTML (no API needed).
 
@@ -91,53 +306,81 @@ class WatchdogAgent:
         results = []
         try:
             search_url = "https://html.duckduckgo.com/html/"
-            response = self.http_client.post(
+            async with self.http_client.stream(
+                "POST",
                 search_url,
                 data={"q": query},
-                headers={"Content-Type": "application/x-www-form-urlencoded"}
-            )
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            for result in soup.select(".result")[:5]:  # Top 5 results
-                title_elem = result.select_one(".result__title a")
-                snippet_elem = result.select_one(".result__snippet")
-
-                if title_elem:
-                    # DuckDuckGo wraps URLs, extract the actual URL
-                    href = title_elem.get("href", "")
-                    # Extract uddg parameter which contains the actual URL
-                    if "uddg=" in href:
-                        import urllib.parse
-                        parsed = urllib.parse.parse_qs(urllib.parse.urlparse(href).query)
-                        actual_url = parsed.get("uddg", [href])[0]
-                    else:
-                        actual_url = href
-
-                    results.append({
-                        "title": title_elem.get_text(strip=True),
-                        "url": actual_url,
-                        "snippet": snippet_elem.get_text(strip=True) if snippet_elem else ""
-                    })
+                headers=self._search_headers
+            ) as response:
+                response.raise_for_status()
+                html = await _read_capped(response, _MAX_SEARCH_BYTES)
+
+            for title, href, snippet in _parse_search_results(html):  # Top 5 results
+                # DuckDuckGo wraps URLs, extract the actual URL
+                # Extract uddg parameter which contains the actual URL
+                if "uddg=" in href:
+                    actual_url = urllib.parse.unquote_plus(href.partition("uddg=")[2].partition("&")[0])
+                else:
+                    actual_url = href
+
+                results.append({
+                    "title": title,
+                    "url": actual_url,
+                    "snippet": snippet
+                })
 
         except Exception as e:
-            print(f"Search failed for '{query}': {e}")
+            log.warning("Search failed for %r: %s", query, e)
 
         return results
 
-    def check_topic(self, topic: WatchTopic) -> UpdateResult:
-        """Check a topic for updates using Claude."""
-        cache = self._load_topic_cache(topic)
+    async def _gather_info(self, topic: WatchTopic, cache: dict) -> list[str]:
+        """
+        Run a topic's searches and URL fetches and collect the text found.
 
-        # Gather information
+        Collection stops once ``_GATHER_BUDGET`` characters have been
+        gathered; the block that crosses the limit is truncated.
+        """
         gathered_info = []
+        budget = _GATHER_BUDGET
+
+        def push(block: str):
+            nonlocal budget
+            if budget > 0:
+                block = block[:budget]
+                budget -= len(block)
+                gathered_info.append(block)
+
+        # Run all searches and URL fetches concurrently
+        queries = topic.search_queries[:3]  # Limit queries
+        urls = topic.urls_to_check[:3]
+        # Conditional request state lives on the agent, so whichever topic's
+        # fetch wins the URL cache fills it in for all of them; the topic's
+        # cache file holds the same dicts, only for URLs it still watches
+        stored = cache.get("urls", {})
+        for url in urls:
+            validators = self._url_validators.setdefault(url, {})
+            if not validators and stored.get(url):
+                validators.update(stored[url])
+        cache["urls"] = {url: self._url_validators[url] for url in urls}
+        tasks = [
+            self._cached(self._search_cache, search, _SEARCH_CACHE_TTL, self._search_web, search)
+            for search in (f"{query} 2024 2025" for query in queries)
+        ]
+        tasks += [
+            self._cached(self._url_cache, url, _URL_CACHE_TTL, self._fetch_url_content, url, cache["urls"][url])
+            for url in urls
+        ]
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        search_outcomes = outcomes[:len(queries)]
+        url_outcomes = outcomes[len(queries):]
 
         # Search for recent news/updates
-        for query in topic.search_queries[:3]:  # Limit queries
-            search_results = self._search_web(f"{query} 2024 2025")
+        for query, search_results in zip(queries, search_outcomes):
+            if isinstance(search_results, BaseException):
+                continue
             for result in search_results[:3]:
-                gathered_info.append(
+                push(
                     f"Search result for '{query}':\n"
                     f"Title: {result['title']}\n"
                     f"URL: {result['url']}\n"
@@ -145,93 +388,148 @@ class WatchdogAgent:
                 )
 
         # Check specific URLs
-        for url in topic.urls_to_check[:3]:
-            content = self._fetch_url_content(url)
-            if content:
-                gathered_info.append(
-                    f"Content from {url}:\n{content[:3000]}\n"
-                )
+        for url, content in zip(urls, url_outcomes):
+            if content and not isinstance(content, BaseException):
+                push(f"Content from {url}:\n{content}\n")
 
-        if not gathered_info:
-            return UpdateResult(
-                topic_name=topic.name,
-                has_update=False,
-                summary="Could not gather any information",
-                confidence=0.0
-            )
+        return gathered_info
 
-        # Create content hash to detect changes
-        content_hash = hashlib.md5("\n".join(gathered_info).encode()).hexdigest()
+    async def _analyze_batch(self, batch: list[tuple[WatchTopic, str, list[str]]]) -> dict[str, dict]:
+        """
+        Ask Claude about several topics in one request.
 
-        # Check if content has changed
-        previous_hash = cache.get("content_hash")
-        previous_summary = cache.get("last_summary", "")
+        ``batch`` holds (topic, previous_summary, gathered_info) tuples.
+        Returns the reported results keyed by topic name.
+        """
+        sections = []
+        for topic, previous_summary, gathered_info in batch:
+            sections.append(
+                f"## Topic: {topic.name}\n"
+                f"Description: {topic.description}\n\n"
+                f"Previous summary (if any): {previous_summary}\n\n"
+                f"Gathered information:\n{chr(10).join(gathered_info)}"
+            )
 
-        # Use Claude to analyze the information
-        prompt = f"""You are monitoring a topic for updates. Analyze the gathered information and determine if there are any significant NEW updates or developments.
+        response = await self.client.messages.create(
+            model="claude-sonnet-4-20250514",
+            max_tokens=500 * len(batch),
+            system=_ANALYSIS_INSTRUCTIONS,
+            tools=[_REPORT_TOOL],
+            tool_choice={"type": "tool", "name": _REPORT_TOOL["name"]},
+            messages=[{"role": "user", "content": "\n\n".join(sections)}]
+        )
 
-Topic: {topic.name}
-Description: {topic.description}
+        # The forced tool call carries the already-parsed results
+        report = next(
+            (block.input for block in response.content if block.type == "tool_use"),
+            {}
+        )
+        return {
+            entry["topic"]: entry
+            for entry in report.get("results", [])
+            if isinstance(entry, dict) and "topic" in entry
+        }
 
-Previous summary (if any): {previous_summary}
+    async def check_topic(self, topic: WatchTopic) -> UpdateResult:
+        """Check a topic for updates using Claude."""
+        return (await self.check_topics([topic]))[0]
 
-Gathered information:
-{chr(10).join(gathered_info)}
+    async def check_topics(self, topics: list[WatchTopic]) -> list[UpdateResult]:
+        """
+        Check several topics for updates.
 
-Analyze this information and respond with a JSON object:
-{{
-    "has_significant_update": true/false,
-    "summary": "Brief 1-2 sentence summary of any updates or current status",
-    "confidence": 0.0-1.0,
-    "source_url": "most relevant URL or null"
-}}
+        Information for all topics is gathered concurrently; topics whose
+        content changed are then analyzed by Claude in shared batches.
+        Results are returned in the same order as ``topics``.
+        """
+        caches = [self._load_topic_cache(topic) for topic in topics]
+        gathered = await asyncio.gather(
+            *(self._gather_info(topic, cache) for topic, cache in zip(topics, caches))
+        )
 
-Only set has_significant_update to true if there is genuinely NEW information that the user should know about. Don't report updates for things that haven't changed."""
+        results: list[UpdateResult | None] = [None] * len(topics)
+        pending = []
+        for i, (topic, cache, gathered_info) in enumerate(zip(topics, caches, gathered)):
+            if not gathered_info:
+                results[i] = UpdateResult(
+                    topic_name=topic.name,
+                    has_update=False,
+                    summary="Could not gather any information",
+                    confidence=0.0
+                )
+                continue
+
+            # Create content hash to detect changes
+            content_hash = _content_hash(gathered_info)
+
+            # Check if content has changed
+            previous_hash = cache.get("content_hash")
+            previous_summary = cache.get("last_summary", "")
+
+            # Nothing new to analyze, skip the Claude call entirely
+            if previous_hash == content_hash:
+                cache["last_checked"] = datetime.now().isoformat()
+                self._save_topic_cache(topic, cache)
+                results[i] = UpdateResult(
+                    topic_name=topic.name,
+                    has_update=False,
+                    summary=previous_summary or "No change since last check",
+                    source_url=cache.get("last_source_url"),
+                    confidence=cache.get("last_confidence", 0.0)
+                )
+                continue
 
-        try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=500,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            pending.append((i, topic, cache, content_hash, previous_summary, gathered_info))
 
-            response_text = response.content[0].text
-
-            # Extract JSON from response
-            import re
-            json_match = re.search(r'\{[^{}]*\}', response_text, re.DOTALL)
-            if json_match:
-                result_data = json.loads(json_match.group())
-            else:
-                result_data = {
-                    "has_significant_update": False,
-                    "summary": "Could not parse response",
-                    "confidence": 0.0,
-                    "source_url": None
-                }
-
-            # Update cache
-            cache["content_hash"] = content_hash
-            cache["last_checked"] = datetime.now().isoformat()
-            cache["last_summary"] = result_data.get("summary", "")
-            self._save_topic_cache(topic, cache)
-
-            return UpdateResult(
-                topic_name=topic.name,
-                has_update=result_data.get("has_significant_update", False),
-                summary=result_data.get("summary", "No summary"),
-                source_url=result_data.get("source_url"),
-                confidence=result_data.get("confidence", 0.0)
-            )
+        batches = [pending[n:n + _BATCH_SIZE] for n in range(0, len(pending), _BATCH_SIZE)]
+        reports = await asyncio.gather(
+            *(
+                self._analyze_batch([(topic, summary, info) for _, topic, _, _, summary, info in batch])
+                for batch in batches
+            ),
+            return_exceptions=True
+        )
 
-        except Exception as e:
-            return UpdateResult(
-                topic_name=topic.name,
-                has_update=False,
-                summary=f"Error checking topic: {e}",
-                confidence=0.0
-            )
+        for batch, report in zip(batches, reports):
+            for i, topic, cache, content_hash, _, _ in batch:
+                if isinstance(report, Exception):
+                    results[i] = UpdateResult(
+                        topic_name=topic.name,
+                        has_update=False,
+                        summary=f"Error checking topic: {report}",
+                        confidence=0.0
+                    )
+                    continue
+
+                result_data = report.get(topic.name)
+                if result_data is None:
+                    results[i] = UpdateResult(
+                        topic_name=topic.name,
+                        has_update=False,
+                        summary="Could not parse response",
+                        confidence=0.0
+                    )
+                    continue
+
+                # Update cache
+                cache["content_hash"] = content_hash
+                cache["last_checked"] = datetime.now().isoformat()
+                cache["last_summary"] = result_data.get("summary", "")
+                cache["last_source_url"] = result_data.get("source_url")
+                cache["last_confidence"] = result_data.get("confidence", 0.0)
+                self._save_topic_cache(topic, cache)
+
+                results[i] = UpdateResult(
+                    topic_name=topic.name,
+                    has_update=result_data.get("has_significant_update", False),
+                    summary=result_data.get("summary", "No summary"),
+                    source_url=result_data.get("source_url"),
+                    confidence=result_data.get("confidence", 0.0)
+                )
+
+        return results
 
-    def close(self):
+    async def close(self):
         """Clean up resources."""
-        self.http_client.close()
+        await self.http_client.aclose()
+        await self.client.close()
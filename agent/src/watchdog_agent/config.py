@@ -1,5 +1,6 @@
 """Configuration management for Watchdog Agent."""
 
+import logging
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -9,6 +10,8 @@ import yaml
 
 from .agent import WatchTopic
 
+log = logging.getLogger(__name__)
+
 
 @dataclass
 class AgentConfig:
@@ -45,7 +48,7 @@ def load_config(config_path: Path | None = None) -> AgentConfig:
                 data = yaml.safe_load(f) or {}
                 _apply_config_data(config, data)
         except Exception as e:
-            print(f"Warning: Failed to load config from {config_path}: {e}")
+            log.warning("Failed to load config from %s: %s", config_path, e)
 
     # Override with environment variables
     if api_key := os.environ.get("ANTHROPIC_API_KEY"):
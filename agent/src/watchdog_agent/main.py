@@ -1,55 +1,59 @@
 """Main entry point for Watchdog Agent."""
 
 import argparse
+import asyncio
+import heapq
+import logging
 import signal
 import sys
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import orjson
 from rich.console import Console
+from rich.logging import RichHandler
 from rich.table import Table
 
-from .agent import WatchdogAgent, WatchTopic
+from .agent import UpdateResult, WatchdogAgent, WatchTopic
 from .config import load_config, save_default_config, AgentConfig
 from .monitors import should_run_check, is_on_ac_power
 from .notifier import notify_update, notify_error, notify_started
 
 console = Console()
 
-# Global flag for graceful shutdown
-_shutdown_requested = False
 
-
-def signal_handler(signum, frame):
-    global _shutdown_requested
-    _shutdown_requested = True
+def request_shutdown(shutdown: asyncio.Event):
+    """Signal handler: wake the daemon loop and stop after the current task."""
+    shutdown.set()
     console.print("\n[yellow]Shutdown requested, finishing current task...[/yellow]")
 
 
-def check_single_topic(agent: WatchdogAgent, topic: WatchTopic, verbose: bool = False) -> bool:
-    """Check a single topic and notify if there's an update."""
+async def check_and_notify(agent: WatchdogAgent, topics: list[WatchTopic], verbose: bool = False) -> list[bool]:
+    """Check topics together and notify for each one with an update."""
     if verbose:
-        console.print(f"[blue]Checking:[/blue] {topic.name}")
+        for topic in topics:
+            console.print(f"[blue]Checking:[/blue] {topic.name}")
 
-    result = agent.check_topic(topic)
+    results = await agent.check_topics(topics)
 
-    if verbose:
-        status = "[green]UPDATE[/green]" if result.has_update else "[dim]No update[/dim]"
-        console.print(f"  {status}: {result.summary}")
+    notified = []
+    for topic, result in zip(topics, results):
+        if verbose:
+            status = "[green]UPDATE[/green]" if result.has_update else "[dim]No update[/dim]"
+            console.print(f"  {topic.name} {status}: {result.summary}")
 
-    if result.has_update and result.confidence > 0.3:
-        notify_update(topic.name, result.summary, result.source_url)
-        return True
+        if result.has_update and result.confidence > 0.3:
+            notify_update(topic.name, result.summary, result.source_url)
+            notified.append(True)
+        else:
+            notified.append(False)
 
-    return False
+    return notified
 
 
 def run_daemon(config: AgentConfig, verbose: bool = False):
     """Run the agent as a background daemon."""
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-
     if not config.anthropic_api_key:
         console.print("[red]Error:[/red] ANTHROPIC_API_KEY not set")
         console.print("Set it in config or environment: export ANTHROPIC_API_KEY=sk-ant-...")
@@ -60,16 +64,78 @@ def run_daemon(config: AgentConfig, verbose: bool = False):
         console.print(f"Edit config at: {config.config_dir / 'config.yaml'}")
         sys.exit(1)
 
+    asyncio.run(_daemon_loop(config, verbose))
+
+
+def _load_schedule(path: Path) -> dict[str, datetime]:
+    """Load the last check time of each topic saved by a previous run."""
+    try:
+        data = orjson.loads(path.read_bytes())
+        return {name: datetime.fromisoformat(checked) for name, checked in data.items()}
+    except (orjson.JSONDecodeError, IOError, AttributeError, TypeError, ValueError):
+        return {}
+
+
+def _save_schedule(path: Path, last_checks: dict[str, datetime]):
+    """Atomically persist the last check time of each topic."""
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(orjson.dumps(
+        {name: checked.isoformat() for name, checked in last_checks.items()},
+        option=orjson.OPT_INDENT_2
+    ))
+    tmp_path.replace(path)
+
+
+async def _wait_for_shutdown(shutdown: asyncio.Event, timeout: float) -> bool:
+    """Sleep up to ``timeout`` seconds; return True if shutdown was requested."""
+    try:
+        await asyncio.wait_for(shutdown.wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+async def _daemon_loop(config: AgentConfig, verbose: bool):
+    """Check topics as they come due until shutdown is requested."""
+    shutdown = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, request_shutdown, shutdown)
+
     agent = WatchdogAgent(api_key=config.anthropic_api_key, cache_dir=config.cache_dir)
 
-    # Track last check time for each topic
-    last_checks: dict[str, datetime] = {}
+    # Ensure minimum interval
+    min_interval = timedelta(minutes=config.min_check_interval_minutes)
+    intervals = [
+        max(timedelta(hours=topic.check_interval_hours), min_interval).total_seconds()
+        for topic in config.topics
+    ]
+
+    # Last check times survive restarts so a reboot doesn't recheck everything
+    schedule_path = config.cache_dir / "schedule.json"
+    last_checks = _load_schedule(schedule_path)
+
+    # Heap of (next_due_timestamp, topic_index); never-checked topics are due now
+    schedule = []
+    for i, topic in enumerate(config.topics):
+        last_check = last_checks.get(topic.name)
+        due_at = last_check.timestamp() + intervals[i] if last_check else time.time()
+        schedule.append((due_at, i))
+    heapq.heapify(schedule)
 
     console.print(f"[green]Watchdog Agent started[/green] - monitoring {len(config.topics)} topic(s)")
     notify_started()
 
     try:
-        while not _shutdown_requested:
+        while not shutdown.is_set():
+            # Sleep until the next topic is due; cap the wait so clock jumps
+            # (e.g. suspend/resume) are noticed within the hour
+            wait = schedule[0][0] - time.time()
+            if wait > 0:
+                if await _wait_for_shutdown(shutdown, min(wait, 3600)):
+                    break
+                continue
+
             # Check if we should run
             can_run, reason = should_run_check(
                 require_ac=config.require_ac_power,
@@ -79,34 +145,30 @@ def run_daemon(config: AgentConfig, verbose: bool = False):
             if not can_run:
                 if verbose:
                     console.print(f"[dim]Skipping checks: {reason}[/dim]")
-                time.sleep(60)  # Check again in a minute
+                await _wait_for_shutdown(shutdown, 60)  # Check again in a minute
                 continue
 
-            # Check each topic if enough time has passed
-            now = datetime.now()
-            for topic in config.topics:
-                if _shutdown_requested:
-                    break
-
-                last_check = last_checks.get(topic.name)
-                interval = timedelta(hours=topic.check_interval_hours)
-
-                # Ensure minimum interval
-                min_interval = timedelta(minutes=config.min_check_interval_minutes)
-                interval = max(interval, min_interval)
-
-                if last_check is None or (now - last_check) >= interval:
-                    try:
-                        check_single_topic(agent, topic, verbose)
-                        last_checks[topic.name] = now
-                    except Exception as e:
-                        console.print(f"[red]Error checking {topic.name}:[/red] {e}")
-
-            # Sleep before next round of checks
-            time.sleep(60)
+            # Collect every topic that has come due
+            now = time.time()
+            due = []
+            while schedule and schedule[0][0] <= now:
+                due.append(heapq.heappop(schedule)[1])
+
+            # Check all due topics in parallel, batching the Claude calls
+            try:
+                await check_and_notify(agent, [config.topics[i] for i in due], verbose)
+                for i in due:
+                    heapq.heappush(schedule, (now + intervals[i], i))
+                    last_checks[config.topics[i].name] = datetime.fromtimestamp(now)
+                _save_schedule(schedule_path, last_checks)
+            except Exception as e:
+                console.print(f"[red]Error checking topics:[/red] {e}")
+                # Retry in a minute, as the old polling loop did
+                for i in due:
+                    heapq.heappush(schedule, (now + 60, i))
 
     finally:
-        agent.close()
+        await agent.close()
         console.print("[yellow]Watchdog Agent stopped[/yellow]")
 
 
@@ -123,25 +185,31 @@ def run_once(config: AgentConfig, topic_name: str | None = None):
             console.print(f"[red]Topic not found:[/red] {topic_name}")
             sys.exit(1)
 
-    agent = WatchdogAgent(api_key=config.anthropic_api_key, cache_dir=config.cache_dir)
+    console.print(f"Checking {len(topics)} topic(s)...")
+    results = asyncio.run(_check_topics(config, topics))
 
-    try:
-        for topic in topics:
-            console.print(f"\n[bold]Checking: {topic.name}[/bold]")
-            result = agent.check_topic(topic)
+    for topic, result in zip(topics, results):
+        console.print(f"\n[bold]{topic.name}[/bold]")
 
-            if result.has_update:
-                console.print(f"[green]UPDATE FOUND![/green]")
-            else:
-                console.print(f"[dim]No significant updates[/dim]")
+        if result.has_update:
+            console.print(f"[green]UPDATE FOUND![/green]")
+        else:
+            console.print(f"[dim]No significant updates[/dim]")
 
-            console.print(f"Summary: {result.summary}")
-            console.print(f"Confidence: {result.confidence:.0%}")
-            if result.source_url:
-                console.print(f"Source: {result.source_url}")
+        console.print(f"Summary: {result.summary}")
+        console.print(f"Confidence: {result.confidence:.0%}")
+        if result.source_url:
+            console.print(f"Source: {result.source_url}")
 
+
+async def _check_topics(config: AgentConfig, topics: list[WatchTopic]) -> list[UpdateResult]:
+    """Check the given topics in parallel with a shared agent."""
+    agent = WatchdogAgent(api_key=config.anthropic_api_key, cache_dir=config.cache_dir)
+
+    try:
+        return await agent.check_topics(topics)
     finally:
-        agent.close()
+        await agent.close()
 
 
 def list_topics(config: AgentConfig):
@@ -200,6 +268,12 @@ def main():
 
     args = parser.parse_args()
 
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(message)s",
+        handlers=[RichHandler(console=console, show_path=False)]
+    )
+
     # Load config
     config = load_config(args.config)
 
@@ -1,53 +1,118 @@
 """System state monitors for power and user activity."""
 
-import subprocess
+import functools
+import time
 from pathlib import Path
 
+try:
+    from jeepney import DBusAddress, DBusErrorResponse, new_method_call
+    from jeepney.io.blocking import open_dbus_connection
+    from jeepney.wrappers import unwrap_msg
+except ImportError:
+    open_dbus_connection = None
+
+try:
+    from Xlib import display as xdisplay
+    from Xlib.error import DisplayError, XError
+except ImportError:
+    xdisplay = None
+
+if open_dbus_connection is not None:
+    _KDE_SCREENSAVER = DBusAddress(
+        "/ScreenSaver",
+        bus_name="org.kde.screensaver",
+        interface="org.kde.screensaver",
+    )
+
+# Opened lazily and kept for the life of the process
+_session_bus = None
+_x_display = None
+
+# Seconds a power-supply reading is reused before sysfs is read again
+_AC_CACHE_SECONDS = 5
 
-def is_on_ac_power() -> bool:
-    """Check if the system is running on AC power."""
-    ac_paths = list(Path("/sys/class/power_supply").glob("AC*")) + \
-               list(Path("/sys/class/power_supply").glob("ACAD*"))
+
+def _find_ac_online_file() -> Path | None:
+    """Locate the sysfs ``online`` file of the AC adapter, if any."""
+    power_supply = Path("/sys/class/power_supply")
+    ac_paths = list(power_supply.glob("AC*")) + list(power_supply.glob("ACAD*"))
 
     for ac_path in ac_paths:
         online_file = ac_path / "online"
         if online_file.exists():
-            try:
-                return online_file.read_text().strip() == "1"
-            except (IOError, PermissionError):
-                continue
+            return online_file
+    return None
+
+
+# Adapters don't appear or vanish at runtime, so discover the path once
+_AC_ONLINE_FILE = _find_ac_online_file()
+
+
+@functools.lru_cache(maxsize=1)
+def _read_ac_online(time_bucket: int) -> bool:
+    """Read the AC adapter state; cached per ``time_bucket``."""
+    try:
+        return _AC_ONLINE_FILE.read_text().strip() == "1"
+    except (IOError, PermissionError):
+        return True
 
+
+def is_on_ac_power() -> bool:
+    """Check if the system is running on AC power."""
     # Fallback: assume AC if we can't detect
-    return True
+    if _AC_ONLINE_FILE is None:
+        return True
+
+    return _read_ac_online(int(time.monotonic() // _AC_CACHE_SECONDS))
+
+
+def get_session_bus():
+    """Return a shared connection to the D-Bus session bus, or None if unavailable."""
+    global _session_bus
+    if _session_bus is None and open_dbus_connection is not None:
+        try:
+            _session_bus = open_dbus_connection(bus="SESSION")
+        except (OSError, KeyError, ValueError):
+            return None
+    return _session_bus
+
+
+def _reset_session_bus():
+    """Drop a broken session bus connection so the next call reconnects."""
+    global _session_bus
+    if _session_bus is not None:
+        try:
+            _session_bus.close()
+        except OSError:
+            pass
+    _session_bus = None
 
 
 def get_idle_time_ms() -> int:
     """Get user idle time in milliseconds using KDE's idle detection."""
-    try:
-        # Try KDE's idle time via D-Bus
-        result = subprocess.run(
-            ["qdbus", "org.kde.screensaver", "/ScreenSaver", "GetSessionIdleTime"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            return int(result.stdout.strip()) * 1000  # Convert to ms
-    except (subprocess.TimeoutExpired, ValueError, FileNotFoundError):
-        pass
-
-    try:
-        # Fallback: use xprintidle if available
-        result = subprocess.run(
-            ["xprintidle"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            return int(result.stdout.strip())
-    except (subprocess.TimeoutExpired, ValueError, FileNotFoundError):
-        pass
+    bus = get_session_bus()
+    if bus is not None:
+        try:
+            # Try KDE's idle time via D-Bus
+            reply = bus.send_and_get_reply(
+                new_method_call(_KDE_SCREENSAVER, "GetSessionIdleTime"),
+                timeout=5
+            )
+            return int(unwrap_msg(reply)[0]) * 1000  # Convert to ms
+        except (DBusErrorResponse, TimeoutError, ValueError):
+            pass
+        except OSError:
+            _reset_session_bus()
+
+    global _x_display
+    if xdisplay is not None:
+        try:
+            # Fallback: ask the X server's MIT-SCREEN-SAVER extension
+            if _x_display is None:
+                _x_display = xdisplay.Display()
+            return _x_display.screen().root.screensaver_query_info().idle
+        except (XError, DisplayError, AttributeError, OSError):
+            _x_display = None
 
     # Can't detect idle time, assume active
     return 0
@@ -1,9 +1,25 @@
 """KDE desktop notification integration."""
 
+import logging
 import subprocess
 from dataclasses import dataclass
 from enum import Enum
 
+from .monitors import _reset_session_bus, get_session_bus
+
+try:
+    from jeepney import DBusAddress, MessageFlag, new_method_call
+
+    _NOTIFICATIONS = DBusAddress(
+        "/org/freedesktop/Notifications",
+        bus_name="org.freedesktop.Notifications",
+        interface="org.freedesktop.Notifications",
+    )
+except ImportError:
+    _NOTIFICATIONS = None
+
+log = logging.getLogger(__name__)
+
 
 class Urgency(Enum):
     LOW = "low"
@@ -11,6 +27,10 @@ class Urgency(Enum):
     CRITICAL = "critical"
 
 
+# Urgency byte values from the freedesktop notification spec
+_URGENCY_LEVELS = {Urgency.LOW: 0, Urgency.NORMAL: 1, Urgency.CRITICAL: 2}
+
+
 @dataclass
 class Notification:
     title: str
@@ -21,8 +41,45 @@ class Notification:
     app_name: str = "Watchdog Agent"
 
 
+def _notify_dbus(notification: Notification) -> bool:
+    """Send a notification in-process over the session bus.
+
+    The message is sent without waiting for a reply, so a slow notification
+    server cannot hold up the daemon's event loop.
+    """
+    bus = get_session_bus() if _NOTIFICATIONS is not None else None
+    if bus is None:
+        return False
+
+    message = new_method_call(
+        _NOTIFICATIONS, "Notify", "susssasa{sv}i",
+        (
+            notification.app_name,
+            0,  # replaces_id
+            notification.icon,
+            notification.title,
+            notification.body,
+            [],  # actions
+            {"urgency": ("y", _URGENCY_LEVELS[notification.urgency])},
+            notification.timeout_ms,
+        )
+    )
+    message.header.flags |= MessageFlag.no_reply_expected
+    try:
+        bus.send(message)
+        return True
+    except OSError:
+        # The message never left; reconnect next time and use notify-send now
+        _reset_session_bus()
+        return False
+
+
 def send_notification(notification: Notification) -> bool:
-    """Send a desktop notification using notify-send."""
+    """Send a desktop notification over D-Bus, falling back to notify-send
+    when no session bus connection is available."""
+    if _notify_dbus(notification):
+        return True
+
     try:
         cmd = [
             "notify-send",
@@ -34,10 +91,17 @@ def send_notification(notification: Notification) -> bool:
             notification.body
         ]
 
-        result = subprocess.run(cmd, capture_output=True, timeout=10)
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-        print(f"Failed to send notification: {e}")
+        # Fire and forget: notify-send queues to the session bus itself
+        subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True
+        )
+        return True
+    except OSError as e:
+        log.warning("Failed to send notification: %s", e)
         return False
 
 
@@ -16,15 +16,39 @@ Kirigami.ApplicationWindow {
     ChatBackend {
         id: backend
 
+        // Row of the assistant bubble being streamed into, or -1
+        property int streamingIndex: -1
+
+        onMessageChunk: function(chunk) {
+            if (streamingIndex < 0) {
+                chatModel.append({
+                    "text": chunk,
+                    "isUser": false
+                })
+                streamingIndex = chatModel.count - 1
+            } else {
+                chatModel.setProperty(streamingIndex, "text",
+                                      chatModel.get(streamingIndex).text + chunk)
+            }
+            chatList.positionViewAtEnd()
+        }
+
         onMessageReceived: function(message, isUser) {
-            chatModel.append({
-                "text": message,
-                "isUser": isUser
-            })
+            // The final reply replaces the streamed text in place
+            if (!isUser && streamingIndex >= 0) {
+                chatModel.setProperty(streamingIndex, "text", message)
+                streamingIndex = -1
+            } else {
+                chatModel.append({
+                    "text": message,
+                    "isUser": isUser
+                })
+            }
             chatList.positionViewAtEnd()
         }
 
         onErrorOccurred: function(error) {
+            streamingIndex = -1
             errorBanner.text = error
             errorBanner.visible = true
         }
@@ -1,13 +1,51 @@
 """Backend for Watchdog Manager - handles Claude API and topic management."""
 
+import asyncio
+import copy
+import importlib.util
 import json
 import os
+import re
+import shutil
+import stat
+import time
+from collections import OrderedDict, deque
 from pathlib import Path
 from typing import Any
 
 import yaml
-from PySide6.QtCore import QObject, Signal, Slot, Property, QAbstractListModel, Qt, QModelIndex
-import anthropic
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+from PySide6.QtCore import (
+    QObject, Signal, Slot, Property, QAbstractListModel, Qt, QModelIndex,
+    QRunnable, QThreadPool, QMetaObject, Q_ARG, QCoreApplication,
+)
+
+# anthropic (and watchdog_agent, which depends on it) pull in httpx and
+# pydantic; both are imported on first use to keep them off the startup path
+_HAS_AGENT = importlib.util.find_spec("watchdog_agent") is not None
+WatchdogAgent = WatchTopic = None
+
+
+def _get_anthropic():
+    """Import and return the anthropic module."""
+    import anthropic
+    return anthropic
+
+
+def _load_agent():
+    """Import the watchdog agent classes into this module."""
+    global WatchdogAgent, WatchTopic
+    if WatchdogAgent is None:
+        from watchdog_agent.agent import WatchdogAgent, WatchTopic
 
 
 SYSTEM_PROMPT = """You are a helpful assistant for managing a topic monitoring system called "Watchdog Agent".
@@ -43,6 +81,95 @@ For general questions or clarifications, respond naturally without JSON.
 Always be concise and helpful. If the user's request is unclear, ask for clarification."""
 
 
+# Fenced ```json block holding an object, and the start of a bare action object.
+# The object match is bounded so malformed replies can't backtrack without limit.
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.{0,8192}?\})\s*```', re.DOTALL)
+_ACTION_RE = re.compile(r'\{\s*"action"')
+_JSON_DECODER = json.JSONDecoder()
+
+# Parsed YAML documents keyed by path, tagged with the (mtime_ns, size) they
+# were read at so an edited file is re-parsed
+_YAML_CACHE_SIZE = 100
+_yaml_cache: OrderedDict[str, tuple[int, int, dict]] = OrderedDict()
+
+
+def _sidecar_path(path: Path) -> Path:
+    """Path of the JSON copy kept next to a YAML file (config.yaml.json)."""
+    return path.with_name(path.name + ".json")
+
+
+def _read_sidecar(path: Path, st: os.stat_result) -> dict | None:
+    """Return the JSON sidecar's data if it was written for this version of ``path``."""
+    try:
+        raw = _sidecar_path(path).read_bytes()
+        sidecar = orjson.loads(raw) if orjson else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(sidecar, dict):
+        return None
+    if sidecar.get("yaml_mtime_ns") != st.st_mtime_ns or sidecar.get("yaml_size") != st.st_size:
+        return None
+    return sidecar.get("data")
+
+
+def _write_sidecar(path: Path, data: dict, st: os.stat_result):
+    """Save ``data`` as JSON next to ``path`` so later loads can skip YAML parsing.
+
+    The sidecar holds the same data as the YAML file (possibly the API key),
+    so it is given the YAML file's permissions.
+    """
+    sidecar = {"yaml_mtime_ns": st.st_mtime_ns, "yaml_size": st.st_size, "data": data}
+    target = _sidecar_path(path)
+    tmp_path = target.with_name(target.name + ".tmp")
+    try:
+        raw = orjson.dumps(sidecar) if orjson else json.dumps(sidecar).encode()
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), stat.S_IMODE(st.st_mode))
+            f.write(raw)
+        os.replace(tmp_path, target)
+    except (OSError, TypeError):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_yaml_cached(path: Path) -> dict:
+    """Parse a YAML file, reusing the last parse while the file is unchanged."""
+    st = os.stat(path)
+    key = str(path)
+    hit = _yaml_cache.get(key)
+    if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        _yaml_cache.move_to_end(key)
+        return copy.deepcopy(hit[2])
+
+    # JSON parses far faster than YAML; only fall back to YAML when the
+    # sidecar is missing or stale
+    data = _read_sidecar(path, st)
+    if data is None:
+        with open(path) as f:
+            data = yaml.load(f, Loader=_SafeLoader) or {}
+        _write_sidecar(path, data, st)
+    _store_yaml_cache(path, data, st)
+    return copy.deepcopy(data)
+
+
+def _store_yaml_cache(path: Path, data: dict, st: os.stat_result | None = None):
+    """Record ``data`` as the current parse of ``path``."""
+    st = st or os.stat(path)
+    key = str(path)
+    _yaml_cache[key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(data))
+    _yaml_cache.move_to_end(key)
+    while len(_yaml_cache) > _YAML_CACHE_SIZE:
+        _yaml_cache.popitem(last=False)
+
+
+def _split_nonblank(s: str) -> list[str]:
+    """Split text into stripped, non-empty lines."""
+    return [line for line in map(str.strip, s.splitlines()) if line]
+
+
 class TopicListModel(QAbstractListModel):
     """Model for displaying topics in QML ListView."""
 
@@ -54,6 +181,18 @@ class TopicListModel(QAbstractListModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._topics: list[dict] = []
+        # Display strings per row, ordered NameRole..QueriesRole, built when
+        # topics change rather than on every data() call
+        self._rows: list[tuple[str, str, str, str]] = []
+
+    @staticmethod
+    def _row_for(topic: dict) -> tuple[str, str, str, str]:
+        return (
+            topic.get("name", ""),
+            topic.get("description", ""),
+            f"{topic.get('check_interval_hours', 24)}h",
+            ", ".join(topic.get("search_queries", [])),
+        )
 
     def roleNames(self):
         return {
@@ -67,32 +206,94 @@ class TopicListModel(QAbstractListModel):
         return len(self._topics)
 
     def data(self, index, role=Qt.DisplayRole):
-        if not index.isValid() or index.row() >= len(self._topics):
+        if not index.isValid() or index.row() >= len(self._rows):
             return None
 
-        topic = self._topics[index.row()]
-
-        if role == self.NameRole:
-            return topic.get("name", "")
-        elif role == self.DescriptionRole:
-            return topic.get("description", "")
-        elif role == self.IntervalRole:
-            return f"{topic.get('check_interval_hours', 24)}h"
-        elif role == self.QueriesRole:
-            return ", ".join(topic.get("search_queries", []))
+        if self.NameRole <= role <= self.QueriesRole:
+            return self._rows[index.row()][role - self.NameRole]
 
         return None
 
     def setTopics(self, topics: list[dict]):
+        """Replace all rows; QML rebuilds every delegate, so use for full reloads only."""
         self.beginResetModel()
-        self._topics = topics
+        self._topics = list(topics)
+        self._rows = [self._row_for(t) for t in self._topics]
         self.endResetModel()
 
+    def insertTopic(self, row: int, topic: dict):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._topics.insert(row, topic)
+        self._rows.insert(row, self._row_for(topic))
+        self.endInsertRows()
+
+    def removeTopicAt(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._topics[row]
+        del self._rows[row]
+        self.endRemoveRows()
+
+    def replaceTopic(self, row: int, topic: dict):
+        self._topics[row] = topic
+        self._rows[row] = self._row_for(topic)
+        index = self.index(row)
+        self.dataChanged.emit(index, index, list(self.roleNames()))
+
+
+# Partial replies are flushed to the GUI at most this often, or sooner once
+# this much text has built up
+_CHUNK_INTERVAL = 0.12
+_CHUNK_MAX_CHARS = 8192
+
+
+class _ClaudeCall(QRunnable):
+    """Runs a Claude request on a worker thread and posts the reply back."""
+
+    def __init__(self, backend: QObject, client, system: list[dict], messages: list[dict]):
+        super().__init__()
+        self._backend = backend
+        self._client = client
+        self._system = system
+        self._messages = messages
+
+    def _post(self, slot: str, text: str):
+        QMetaObject.invokeMethod(self._backend, slot, Qt.QueuedConnection, Q_ARG(str, text))
+
+    def run(self):
+        try:
+            parts = []
+            pending = []
+            pending_chars = 0
+            last_flush = time.monotonic()
+            with self._client.messages.stream(
+                model="claude-sonnet-4-20250514",
+                max_tokens=1024,
+                system=self._system,
+                messages=self._messages
+            ) as stream:
+                # Forward text in batches so the GUI isn't woken per token
+                for delta in stream.text_stream:
+                    parts.append(delta)
+                    pending.append(delta)
+                    pending_chars += len(delta)
+                    now = time.monotonic()
+                    if now - last_flush > _CHUNK_INTERVAL or pending_chars > _CHUNK_MAX_CHARS:
+                        self._post("_onChunk", "".join(pending))
+                        pending.clear()
+                        pending_chars = 0
+                        last_flush = now
+            if pending:
+                self._post("_onChunk", "".join(pending))
+            self._post("_onResponse", "".join(parts))
+        except Exception as e:
+            self._post("_onError", str(e))
+
 
 class ChatBackend(QObject):
     """Backend handling Claude API and topic management."""
 
     messageReceived = Signal(str, bool)  # message, isUser
+    messageChunk = Signal(str)  # partial assistant reply while streaming
     topicsChanged = Signal()
     errorOccurred = Signal(str)
     busyChanged = Signal()
@@ -101,15 +302,36 @@ class ChatBackend(QObject):
         super().__init__(parent)
         self._config_path = Path.home() / ".config" / "watchdog-agent" / "config.yaml"
         self._topics: list[dict] = []
+        # Full parsed config, kept so saves don't re-read the file, and the
+        # file's mtime when it was read or last written by us
+        self._config_doc: dict = {}
+        self._config_mtime_ns: int | None = None
+        # Lowercased topic name -> position in self._topics
+        self._name_index: dict[str, int] = {}
+        # JSON list of topic names for the chat context, rebuilt on change
+        self._topic_names_json = "[]"
         self._topic_model = TopicListModel(self)
         self._busy = False
-        self._conversation: list[dict] = []
-
+        # Oldest turns drop off automatically past 20 messages
+        self._conversation: deque[dict] = deque(maxlen=20)
+        self._pool = QThreadPool.globalInstance()
+
+        # One agent (and its HTTP connection pool) for the backend's lifetime,
+        # driven on a private event loop that persists between checks
+        self._agent = None
+        self._loop = asyncio.new_event_loop()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._shutdown)
+
+        # The Anthropic client (and the anthropic import) waits for the
+        # first message, keeping both off the path to the first frame
         api_key = os.environ.get("ANTHROPIC_API_KEY")
         if api_key and api_key != "sk-ant-YOUR-KEY-HERE":
-            self._client = anthropic.Anthropic(api_key=api_key)
+            self._api_key = api_key
         else:
-            self._client = None
+            self._api_key = None
+        self._client = None
 
         self._load_config()
 
@@ -123,6 +345,27 @@ class ChatBackend(QObject):
 
     busy = Property(bool, _get_busy, notify=busyChanged)
 
+    def _get_client(self):
+        """Return the Anthropic client, creating it on first use, or None without a key."""
+        if self._client is None and self._api_key:
+            self._client = _get_anthropic().Anthropic(api_key=self._api_key)
+        return self._client
+
+    def _get_agent(self, api_key: str):
+        """Return the shared WatchdogAgent, creating it on first use."""
+        if self._agent is None:
+            _load_agent()
+            self._agent = WatchdogAgent(api_key=api_key)
+        return self._agent
+
+    @Slot()
+    def _shutdown(self):
+        """Close the shared agent's connections when the application quits."""
+        if self._agent is not None:
+            self._loop.run_until_complete(self._agent.close())
+            self._agent = None
+        self._loop.close()
+
     @Property(QObject, constant=True)
     def topicModel(self):
         return self._topic_model
@@ -131,54 +374,96 @@ class ChatBackend(QObject):
         """Load topics from config file."""
         if self._config_path.exists():
             try:
-                with open(self._config_path) as f:
-                    data = yaml.safe_load(f) or {}
-                    self._topics = data.get("topics", [])
-                    self._topic_model.setTopics(self._topics)
+                mtime_ns = self._config_path.stat().st_mtime_ns
+                data = _load_yaml_cached(self._config_path)
+                self._config_doc = data
+                self._config_mtime_ns = mtime_ns
+                self._topics = data.get("topics", [])
+                self._reindex()
+                self._topic_model.setTopics(self._topics)
             except Exception as e:
                 self.errorOccurred.emit(f"Failed to load config: {e}")
 
     def _save_config(self):
         """Save topics to config file."""
         try:
-            # Load existing config to preserve other settings
-            if self._config_path.exists():
-                with open(self._config_path) as f:
-                    data = yaml.safe_load(f) or {}
-            else:
-                data = {}
-
+            # Re-read only if the file changed under us, to preserve
+            # settings edited elsewhere
+            if not self._config_path.exists():
+                self._config_doc = {}
+            elif self._config_path.stat().st_mtime_ns != self._config_mtime_ns:
+                self._config_doc = _load_yaml_cached(self._config_path)
+
+            data = self._config_doc
             data["topics"] = self._topics
 
+            # Write a temp file and rename it over the config so readers
+            # (including the agent) never see a half-written file
             self._config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._config_path, "w") as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            tmp_path = self._config_path.with_suffix(".yaml.tmp")
+            try:
+                with open(tmp_path, "w") as f:
+                    yaml.dump(data, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                # Keep the config's permissions; it may hold the API key
+                if self._config_path.exists():
+                    shutil.copymode(self._config_path, tmp_path)
+                os.replace(tmp_path, self._config_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            # The file now holds exactly this document; skip re-parsing it
+            st = os.stat(self._config_path)
+            self._config_mtime_ns = st.st_mtime_ns
+            _store_yaml_cache(self._config_path, data, st)
+            _write_sidecar(self._config_path, data, st)
 
-            self._topic_model.setTopics(self._topics)
             self.topicsChanged.emit()
 
         except Exception as e:
             self.errorOccurred.emit(f"Failed to save config: {e}")
 
+    def _reindex(self):
+        """Rebuild the name lookup and chat context after topics change."""
+        self._name_index = {}
+        for i, topic in enumerate(self._topics):
+            # First occurrence wins, as with a linear scan
+            self._name_index.setdefault(topic.get("name", "").lower(), i)
+        self._refresh_topic_names()
+
+    def _refresh_topic_names(self):
+        """Rebuild the topic-name JSON sent to Claude as chat context."""
+        self._topic_names_json = json.dumps([t.get("name", "") for t in self._topics])
+
+    def _find_topic(self, name: str) -> int | None:
+        """Return the index of the topic with this name, ignoring case."""
+        return self._name_index.get(name.lower())
+
     def _add_topic(self, topic: dict) -> str:
         """Add a new topic."""
         # Check for duplicate
-        for existing in self._topics:
-            if existing.get("name", "").lower() == topic.get("name", "").lower():
-                return f"Topic '{topic['name']}' already exists."
+        if self._find_topic(topic.get("name", "")) is not None:
+            return f"Topic '{topic['name']}' already exists."
 
         self._topics.append(topic)
+        self._name_index[topic.get("name", "").lower()] = len(self._topics) - 1
+        self._refresh_topic_names()
+        self._topic_model.insertTopic(len(self._topics) - 1, topic)
         self._save_config()
         return f"Added topic: {topic['name']}"
 
     def _remove_topic(self, name: str) -> str:
         """Remove a topic by name."""
-        for i, topic in enumerate(self._topics):
-            if topic.get("name", "").lower() == name.lower():
-                self._topics.pop(i)
-                self._save_config()
-                return f"Removed topic: {name}"
-        return f"Topic not found: {name}"
+        i = self._find_topic(name)
+        if i is None:
+            return f"Topic not found: {name}"
+
+        self._topics.pop(i)
+        self._reindex()
+        self._topic_model.removeTopicAt(i)
+        self._save_config()
+        return f"Removed topic: {name}"
 
     def _list_topics(self) -> str:
         """List all topics."""
@@ -191,48 +476,40 @@ class ChatBackend(QObject):
             lines.append(f"  {topic.get('description', '')}\n")
         return "\n".join(lines)
 
-    def _extract_json(self, text: str) -> dict | None:
-        """Extract JSON object from text, handling nested structures."""
-        import re
-
-        # Try to find JSON in code blocks first
-        code_block = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', text, re.DOTALL)
-        if code_block:
-            try:
-                return json.loads(code_block.group(1))
-            except json.JSONDecodeError:
-                pass
-
-        # Try to find a JSON object by matching braces
-        start = text.find('{"action"')
-        if start == -1:
-            start = text.find('{ "action"')
-        if start == -1:
+    def _extract_json(self, text: str, fence: int | None = None) -> dict | None:
+        """Extract JSON object from text, handling nested structures.
+
+        ``fence`` is the index of the first ``` in ``text`` (-1 if none), when
+        the caller has already located it.
+        """
+        # Try to find JSON in code blocks first; plain replies skip the regex
+        if fence is None:
+            fence = text.find("```")
+        if fence != -1:
+            code_block = _JSON_BLOCK_RE.search(text, fence)
+            if code_block:
+                try:
+                    return json.loads(code_block.group(1))
+                except json.JSONDecodeError:
+                    pass
+
+        # Try to find a bare JSON object starting with "action"
+        action = _ACTION_RE.search(text)
+        if not action:
             return None
 
-        # Count braces to find the end
-        depth = 0
-        end = start
-        for i, char in enumerate(text[start:], start):
-            if char == '{':
-                depth += 1
-            elif char == '}':
-                depth -= 1
-                if depth == 0:
-                    end = i + 1
-                    break
-
-        if end > start:
-            try:
-                return json.loads(text[start:end])
-            except json.JSONDecodeError:
-                pass
-
-        return None
+        # Decode one object from there; the decoder finds where it ends
+        try:
+            data, _ = _JSON_DECODER.raw_decode(text, action.start())
+        except ValueError:
+            return None
+        return data
 
     def _process_ai_response(self, response: str) -> str:
         """Process AI response and execute any actions."""
-        data = self._extract_json(response)
+        # Text before the first fence is the AI's explanation
+        head, sep, _ = response.partition("```")
+        data = self._extract_json(response, len(head) if sep else -1)
 
         if data:
             action = data.get("action")
@@ -255,7 +532,7 @@ class ChatBackend(QObject):
                 details.append(f"**Check interval:** {topic.get('check_interval_hours', 24)} hours")
 
                 # Include AI's explanation if present
-                explanation = response.split('```')[0].strip() if '```' in response else ""
+                explanation = head.strip() if sep else ""
                 if explanation:
                     return explanation + "\n\n" + "\n".join(details)
                 return "\n".join(details)
@@ -274,7 +551,8 @@ class ChatBackend(QObject):
         if not message.strip():
             return
 
-        if not self._client:
+        client = self._get_client()
+        if not client:
             self.errorOccurred.emit("API key not configured. Set ANTHROPIC_API_KEY environment variable.")
             return
 
@@ -283,26 +561,28 @@ class ChatBackend(QObject):
 
         self._set_busy(True)
 
-        try:
-            # Add to conversation
-            self._conversation.append({"role": "user", "content": message})
+        # Add to conversation
+        self._conversation.append({"role": "user", "content": message})
 
-            # Keep conversation manageable
-            if len(self._conversation) > 20:
-                self._conversation = self._conversation[-20:]
+        # Add context about current topics
+        system = [
+            {"type": "text", "text": SYSTEM_PROMPT},
+            {"type": "text", "text": "Current topics: " + self._topic_names_json},
+        ]
 
-            # Add context about current topics
-            context = f"\n\nCurrent topics: {json.dumps([t['name'] for t in self._topics])}"
+        # Call Claude off the GUI thread so the UI keeps redrawing; the reply
+        # streams back through _onChunk, then _onResponse / _onError
+        self._pool.start(_ClaudeCall(self, client, system, list(self._conversation)))
 
-            response = self._client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=1024,
-                system=SYSTEM_PROMPT + context,
-                messages=self._conversation
-            )
-
-            ai_message = response.content[0].text
+    @Slot(str)
+    def _onChunk(self, text: str):
+        """Forward part of a streaming Claude reply to the UI."""
+        self.messageChunk.emit(text)
 
+    @Slot(str)
+    def _onResponse(self, ai_message: str):
+        """Handle a Claude reply delivered from the worker thread."""
+        try:
             # Process any actions in the response
             result = self._process_ai_response(ai_message)
 
@@ -318,6 +598,12 @@ class ChatBackend(QObject):
         finally:
             self._set_busy(False)
 
+    @Slot(str)
+    def _onError(self, error: str):
+        """Handle a failed Claude request delivered from the worker thread."""
+        self.errorOccurred.emit(error)
+        self._set_busy(False)
+
     @Slot()
     def refreshTopics(self):
         """Reload topics from config."""
@@ -332,6 +618,10 @@ class ChatBackend(QObject):
     @Slot()
     def checkAllTopics(self):
         """Force check all topics now (ignores power/idle state)."""
+        if not _HAS_AGENT:
+            self.errorOccurred.emit("watchdog-agent not installed. Run: pip install -e ~/code/apps/watchdog-agent")
+            return
+
         if not self._topics:
             self.messageReceived.emit("No topics to check.", False)
             return
@@ -340,42 +630,38 @@ class ChatBackend(QObject):
         self.messageReceived.emit("Checking all topics...", False)
 
         try:
-            # Import watchdog agent
-            from watchdog_agent.agent import WatchdogAgent, WatchTopic
-
             api_key = os.environ.get("ANTHROPIC_API_KEY")
             if not api_key or api_key == "sk-ant-YOUR-KEY-HERE":
                 self.errorOccurred.emit("API key not configured")
                 return
 
-            agent = WatchdogAgent(api_key=api_key)
+            agent = self._get_agent(api_key)
+            # A forced check must hit the network, not the agent's TTL caches
+            agent.clear_caches()
 
-            results = []
-            for topic_data in self._topics:
-                topic = WatchTopic(
+            topics = [
+                WatchTopic(
                     name=topic_data["name"],
                     description=topic_data.get("description", ""),
                     search_queries=topic_data.get("search_queries", []),
                     urls_to_check=topic_data.get("urls_to_check", []),
                     check_interval_hours=topic_data.get("check_interval_hours", 24)
                 )
+                for topic_data in self._topics
+            ]
 
-                result = agent.check_topic(topic)
-
+            results = []
+            for topic, result in zip(topics, self._loop.run_until_complete(agent.check_topics(topics))):
                 if result.has_update:
                     results.append(f"**{topic.name}**: {result.summary}")
                 else:
                     results.append(f"**{topic.name}**: No updates")
 
-            agent.close()
-
             if results:
                 self.messageReceived.emit("\n\n".join(results), False)
             else:
                 self.messageReceived.emit("All checks complete. No updates found.", False)
 
-        except ImportError:
-            self.errorOccurred.emit("watchdog-agent not installed. Run: pip install -e ~/code/apps/watchdog-agent")
         except Exception as e:
             self.errorOccurred.emit(f"Check failed: {e}")
         finally:
@@ -390,8 +676,8 @@ class ChatBackend(QObject):
             return
 
         # Parse text areas into lists
-        queries = [q.strip() for q in queries_text.split("\n") if q.strip()]
-        urls = [u.strip() for u in urls_text.split("\n") if u.strip()]
+        queries = _split_nonblank(queries_text)
+        urls = _split_nonblank(urls_text)
 
         topic = {
             "name": name.strip(),
@@ -407,66 +693,70 @@ class ChatBackend(QObject):
     @Slot(str, result="QVariant")
     def getTopicDetails(self, name: str):
         """Get full topic details for editing."""
-        for topic in self._topics:
-            if topic.get("name", "").lower() == name.lower():
-                return {
-                    "name": topic.get("name", ""),
-                    "description": topic.get("description", ""),
-                    "search_queries": topic.get("search_queries", []),
-                    "urls_to_check": topic.get("urls_to_check", []),
-                    "check_interval_hours": topic.get("check_interval_hours", 24)
-                }
-        return None
+        i = self._find_topic(name)
+        if i is None:
+            return None
+
+        topic = self._topics[i]
+        return {
+            "name": topic.get("name", ""),
+            "description": topic.get("description", ""),
+            "search_queries": topic.get("search_queries", []),
+            "urls_to_check": topic.get("urls_to_check", []),
+            "check_interval_hours": topic.get("check_interval_hours", 24)
+        }
 
     @Slot(str, str, str, str, str, int)
     def updateTopic(self, original_name: str, name: str, description: str,
                     queries_text: str, urls_text: str, interval: int):
         """Update an existing topic."""
         # Parse text areas into lists
-        queries = [q.strip() for q in queries_text.split("\n") if q.strip()]
-        urls = [u.strip() for u in urls_text.split("\n") if u.strip()]
+        queries = _split_nonblank(queries_text)
+        urls = _split_nonblank(urls_text)
 
         # Find and update the topic
-        for i, topic in enumerate(self._topics):
-            if topic.get("name", "").lower() == original_name.lower():
-                self._topics[i] = {
-                    "name": name,
-                    "description": description,
-                    "search_queries": queries,
-                    "urls_to_check": urls,
-                    "check_interval_hours": interval
-                }
-                self._save_config()
-                self.messageReceived.emit(f"Updated topic: {name}", False)
-                return
+        i = self._find_topic(original_name)
+        if i is None:
+            self.errorOccurred.emit(f"Topic not found: {original_name}")
+            return
 
-        self.errorOccurred.emit(f"Topic not found: {original_name}")
+        self._topics[i] = {
+            "name": name,
+            "description": description,
+            "search_queries": queries,
+            "urls_to_check": urls,
+            "check_interval_hours": interval
+        }
+        self._reindex()
+        self._topic_model.replaceTopic(i, self._topics[i])
+        self._save_config()
+        self.messageReceived.emit(f"Updated topic: {name}", False)
 
     @Slot(str)
     def checkSingleTopic(self, name: str):
         """Force check a single topic now."""
-        topic_data = None
-        for t in self._topics:
-            if t.get("name", "").lower() == name.lower():
-                topic_data = t
-                break
+        if not _HAS_AGENT:
+            self.errorOccurred.emit("watchdog-agent not installed")
+            return
 
-        if not topic_data:
+        i = self._find_topic(name)
+        if i is None:
             self.errorOccurred.emit(f"Topic not found: {name}")
             return
+        topic_data = self._topics[i]
 
         self._set_busy(True)
         self.messageReceived.emit(f"Checking {name}...", False)
 
         try:
-            from watchdog_agent.agent import WatchdogAgent, WatchTopic
-
             api_key = os.environ.get("ANTHROPIC_API_KEY")
             if not api_key or api_key == "sk-ant-YOUR-KEY-HERE":
                 self.errorOccurred.emit("API key not configured")
                 return
 
-            agent = WatchdogAgent(api_key=api_key)
+            agent = self._get_agent(api_key)
+            # A forced check must hit the network, not the agent's TTL caches
+            agent.clear_caches()
 
             topic = WatchTopic(
                 name=topic_data["name"],
@@ -476,8 +766,7 @@ class ChatBackend(QObject):
                 check_interval_hours=topic_data.get("check_interval_hours", 24)
             )
 
-            result = agent.check_topic(topic)
-            agent.close()
+            result = self._loop.run_until_complete(agent.check_topic(topic))
 
             if result.has_update:
                 msg = f"**Update found for {topic.name}!**\n\n{result.summary}"
@@ -488,8 +777,6 @@ class ChatBackend(QObject):
 
             self.messageReceived.emit(msg, False)
 
-        except ImportError:
-            self.errorOccurred.emit("watchdog-agent not installed")
         except Exception as e:
             self.errorOccurred.emit(f"Check failed: {e}")
         finally: